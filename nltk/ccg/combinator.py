@@ -107,10 +107,7 @@ class UndirectedFunctionApplication(UndirectedBinaryCombinator):
     """
 
     def can_combine(self, function, argument):
-        if not function.is_function():
-            return False
-
-        return not function.arg().can_unify(argument) is None
+        return function.is_function() and function.arg().can_unify(argument) is not None
 
     def combine(self, function, argument):
         if not function.is_function():
@@ -49,18 +49,18 @@ class DecisionTreeClassifier(ClassifierI):
         return list(set(labels))
 
     def classify(self, featureset):
-        # Decision leaf:
-        if self._fname is None:
-            return self._label
-
-        # Decision tree:
-        fval = featureset.get(self._fname)
-        if fval in self._decisions:
-            return self._decisions[fval].classify(featureset)
-        elif self._default is not None:
-            return self._default.classify(featureset)
-        else:
-            return self._label
+        # Walk down the tree in a loop, rather than recursing into each
+        # subtree, until reaching a decision leaf.
+        tree = self
+        while tree._fname is not None:
+            fval = featureset.get(tree._fname)
+            if fval in tree._decisions:
+                tree = tree._decisions[fval]
+            elif tree._default is not None:
+                tree = tree._default
+            else:
+                break
+        return tree._label
 
     def error(self, labeled_featuresets):
         errors = 0
@@ -148,28 +148,13 @@ class DecisionTreeClassifier(ClassifierI):
             individual binary features, rather than using a single n-way
             branch for each feature.
         """
-        # Collect a list of all feature names.
-        feature_names = set()
-        for featureset, label in labeled_featuresets:
-            for fname in featureset:
-                feature_names.add(fname)
-
-        # Collect a list of the values each feature can take.
         if feature_values is None and binary:
-            feature_values = defaultdict(set)
-            for featureset, label in labeled_featuresets:
-                for fname, fval in featureset.items():
-                    feature_values[fname].add(fval)
+            feature_values = DecisionTreeClassifier._feature_values(labeled_featuresets)
 
         # Start with a stump.
-        if not binary:
-            tree = DecisionTreeClassifier.best_stump(
-                feature_names, labeled_featuresets, verbose
-            )
-        else:
-            tree = DecisionTreeClassifier.best_binary_stump(
-                feature_names, labeled_featuresets, feature_values, verbose
-            )
+        tree = DecisionTreeClassifier._train_stump(
+            labeled_featuresets, binary, feature_values, verbose
+        )
 
         # Refine the stump.
         tree.refine(
@@ -185,6 +170,33 @@ class DecisionTreeClassifier(ClassifierI):
         # Return it
         return tree
 
+    @staticmethod
+    def _feature_values(labeled_featuresets):
+        """
+        Collect a list of the values each feature can take.
+        """
+        feature_values = defaultdict(set)
+        for featureset, label in labeled_featuresets:
+            for fname, fval in featureset.items():
+                feature_values[fname].add(fval)
+        return feature_values
+
+    @staticmethod
+    def _train_stump(labeled_featuresets, binary, feature_values, verbose):
+        # Collect the names of all features while counting their values,
+        # and share the counts with the stump search.
+        freqs = DecisionTreeClassifier._value_label_freqs(None, labeled_featuresets)
+        feature_names = set(freqs[1])
+
+        if not binary:
+            return DecisionTreeClassifier._best_stump(
+                feature_names, labeled_featuresets, freqs, verbose
+            )
+        else:
+            return DecisionTreeClassifier._best_binary_stump(
+                feature_names, labeled_featuresets, feature_values, freqs, verbose
+            )
+
     @staticmethod
     def leaf(labeled_featuresets):
         label = FreqDist(label for (featureset, label) in labeled_featuresets).max()
@@ -213,59 +225,180 @@ class DecisionTreeClassifier(ClassifierI):
         feature_values=None,
         verbose=False,
     ):
+        # Grow the tree depth-first with an explicit stack rather than
+        # by recursion.  Each entry is a subtree that still has to be
+        # trained, along with the node and branch it will replace, and
+        # the feature values to train it with.
+        stack = []
+        self._push_refinements(
+            stack,
+            labeled_featuresets,
+            entropy_cutoff,
+            depth_cutoff,
+            support_cutoff,
+            feature_values,
+        )
+        while stack:
+            (
+                parent,
+                is_default,
+                fval,
+                fval_featuresets,
+                depth_cutoff,
+                fval_feature_values,
+            ) = stack.pop()
+            if fval_feature_values is None and binary:
+                # As in train(), collect the values from the featuresets
+                # of the subtree, for it and everything below it.
+                fval_feature_values = DecisionTreeClassifier._feature_values(
+                    fval_featuresets
+                )
+            tree = DecisionTreeClassifier._train_stump(
+                fval_featuresets, binary, fval_feature_values, verbose
+            )
+            if is_default:
+                parent._default = tree
+            else:
+                parent._decisions[fval] = tree
+            tree._push_refinements(
+                stack,
+                fval_featuresets,
+                entropy_cutoff,
+                depth_cutoff - 1,
+                support_cutoff,
+                fval_feature_values,
+            )
+
+    def _push_refinements(
+        self,
+        stack,
+        labeled_featuresets,
+        entropy_cutoff,
+        depth_cutoff,
+        support_cutoff,
+        feature_values,
+    ):
+        """
+        Push the children of this node that should be replaced by
+        trained subtrees onto ``stack``, in reverse order, so that they
+        are popped in the same order a recursive refinement visits them.
+        """
         if len(labeled_featuresets) <= support_cutoff:
             return
         if self._fname is None:
             return
         if depth_cutoff <= 0:
             return
-        for fval in self._decisions:
-            fval_featuresets = [
-                (featureset, label)
-                for (featureset, label) in labeled_featuresets
-                if featureset.get(self._fname) == fval
-            ]
+        # Partition the featuresets by their value for this node's
+        # feature in a single pass, rather than rescanning all of them
+        # once for every branch.
+        partitions = {fval: [] for fval in self._decisions}
+        default_featuresets = []
+        for featureset, label in labeled_featuresets:
+            fval = featureset.get(self._fname)
+            if fval in partitions:
+                partitions[fval].append((featureset, label))
+            else:
+                default_featuresets.append((featureset, label))
 
+        refinements = []
+        for fval, fval_featuresets in partitions.items():
             label_freqs = FreqDist(label for (featureset, label) in fval_featuresets)
             if entropy(MLEProbDist(label_freqs)) > entropy_cutoff:
-                self._decisions[fval] = DecisionTreeClassifier.train(
-                    fval_featuresets,
-                    entropy_cutoff,
-                    depth_cutoff,
-                    support_cutoff,
-                    binary,
-                    feature_values,
-                    verbose,
+                refinements.append(
+                    (self, False, fval, fval_featuresets, depth_cutoff, feature_values)
                 )
         if self._default is not None:
-            default_featuresets = [
-                (featureset, label)
-                for (featureset, label) in labeled_featuresets
-                if featureset.get(self._fname) not in self._decisions
-            ]
             label_freqs = FreqDist(label for (featureset, label) in default_featuresets)
             if entropy(MLEProbDist(label_freqs)) > entropy_cutoff:
-                self._default = DecisionTreeClassifier.train(
-                    default_featuresets,
-                    entropy_cutoff,
-                    depth_cutoff,
-                    support_cutoff,
-                    binary,
-                    feature_values,
-                    verbose,
+                refinements.append(
+                    (
+                        self,
+                        True,
+                        None,
+                        default_featuresets,
+                        depth_cutoff,
+                        feature_values,
+                    )
                 )
+        stack.extend(reversed(refinements))
+
+    @staticmethod
+    def _value_label_freqs(feature_names, labeled_featuresets):
+        """
+        Count labels in ``labeled_featuresets``, both overall and for
+        each value of each feature in ``feature_names``, or of every
+        feature that occurs if ``feature_names`` is None.
+
+        :return: A tuple ``(label_freqs, value_label_freqs)``, where
+            ``label_freqs[label]`` is the number of featuresets with
+            that label, and ``value_label_freqs[fname][fval][label]`` is
+            the number of those featuresets with ``fname=fval``.
+            Featuresets that lack a feature are counted under the value
+            None, matching ``featureset.get(fname)``.
+        """
+        label_freqs = defaultdict(int)
+        if feature_names is None:
+            freqs = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+        else:
+            freqs = {
+                fname: defaultdict(lambda: defaultdict(int)) for fname in feature_names
+            }
+        for featureset, label in labeled_featuresets:
+            label_freqs[label] += 1
+            for fname, fval in featureset.items():
+                if feature_names is None or fname in freqs:
+                    freqs[fname][fval][label] += 1
+
+        # Whatever is not accounted for by the features that are present
+        # belongs to the featuresets where the feature is missing.
+        for fname_freqs in freqs.values():
+            missing = dict(label_freqs)
+            for fval_freqs in fname_freqs.values():
+                for label, count in fval_freqs.items():
+                    missing[label] -= count
+            for label, count in missing.items():
+                if count:
+                    fname_freqs[None][label] += count
+        return label_freqs, freqs
 
     @staticmethod
     def best_stump(feature_names, labeled_featuresets, verbose=False):
-        best_stump = DecisionTreeClassifier.leaf(labeled_featuresets)
-        best_error = best_stump.error(labeled_featuresets)
+        freqs = DecisionTreeClassifier._value_label_freqs(
+            feature_names, labeled_featuresets
+        )
+        return DecisionTreeClassifier._best_stump(
+            feature_names, labeled_featuresets, freqs, verbose
+        )
+
+    @staticmethod
+    def _best_stump(feature_names, labeled_featuresets, freqs, verbose):
+        label_freqs, value_label_freqs = freqs
+        # Candidates are compared by the number of featuresets they
+        # classify correctly, which is exact and avoids computing an
+        # error rate for every candidate.
+        best_correct = max(label_freqs.values())
+        best_fname = None
         for fname in feature_names:
-            stump = DecisionTreeClassifier.stump(fname, labeled_featuresets)
-            stump_error = stump.error(labeled_featuresets)
-            if stump_error < best_error:
-                best_error = stump_error
-                best_stump = stump
+            # A stump assigns each feature value its most frequent label,
+            # so its error follows directly from the label counts for
+            # each value; there is no need to build the stump and
+            # classify every featureset with it.
+            correct = sum(
+                max(fval_freqs.values())
+                for fval_freqs in value_label_freqs[fname].values()
+            )
+            if correct > best_correct:
+                best_correct = correct
+                best_fname = fname
+        if best_fname is not None:
+            best_stump = DecisionTreeClassifier.stump(best_fname, labeled_featuresets)
+        else:
+            best_stump = DecisionTreeClassifier.leaf(labeled_featuresets)
         if verbose:
+            best_error = (len(labeled_featuresets) - best_correct) / len(
+                labeled_featuresets
+            )
             print(
                 "best stump for {:6d} toks uses {:20} err={:6.4f}".format(
                     len(labeled_featuresets), best_stump._fname, best_error
@@ -300,17 +433,46 @@ class DecisionTreeClassifier(ClassifierI):
     def best_binary_stump(
         feature_names, labeled_featuresets, feature_values, verbose=False
     ):
-        best_stump = DecisionTreeClassifier.leaf(labeled_featuresets)
-        best_error = best_stump.error(labeled_featuresets)
+        freqs = DecisionTreeClassifier._value_label_freqs(
+            feature_names, labeled_featuresets
+        )
+        return DecisionTreeClassifier._best_binary_stump(
+            feature_names, labeled_featuresets, feature_values, freqs, verbose
+        )
+
+    @staticmethod
+    def _best_binary_stump(
+        feature_names, labeled_featuresets, feature_values, freqs, verbose
+    ):
+        label_freqs, value_label_freqs = freqs
+        best_correct = max(label_freqs.values())
+        best_split = None
         for fname in feature_names:
+            freqs = value_label_freqs[fname]
             for fval in feature_values[fname]:
-                stump = DecisionTreeClassifier.binary_stump(
-                    fname, fval, labeled_featuresets
-                )
-                stump_error = stump.error(labeled_featuresets)
-                if stump_error < best_error:
-                    best_error = stump_error
-                    best_stump = stump
+                if fval not in freqs:
+                    # No featureset at this node has fname=fval, so the
+                    # stump would not split the node at all.
+                    continue
+                # The binary stump labels featuresets with fname=fval by
+                # their most frequent label, and all others by theirs.
+                # The label counts of the others are what remains of the
+                # counts for the whole node.
+                pos_freqs = freqs[fval]
+                neg_freqs = [
+                    count - pos_freqs.get(label, 0)
+                    for label, count in label_freqs.items()
+                ]
+                correct = max(pos_freqs.values()) + max(neg_freqs)
+                if correct > best_correct:
+                    best_correct = correct
+                    best_split = (fname, fval)
+        if best_split is not None:
+            best_stump = DecisionTreeClassifier.binary_stump(
+                *best_split, labeled_featuresets
+            )
+        else:
+            best_stump = DecisionTreeClassifier.leaf(labeled_featuresets)
         if verbose:
             if best_stump._decisions:
                 descr = "{}={}".format(
@@ -318,6 +480,9 @@ class DecisionTreeClassifier(ClassifierI):
                 )
             else:
                 descr = "(default)"
+            best_error = (len(labeled_featuresets) - best_correct) / len(
+                labeled_featuresets
+            )
             print(
                 "best stump for {:6d} toks uses {:20} err={:6.4f}".format(
                     len(labeled_featuresets), descr, best_error
@@ -11,11 +11,20 @@
 
 import gc
 import re
+import weakref
 
 import nltk
 
 TRY_ZIPFILE_FIRST = False
 
+# The lazy corpora that are currently loaded, keyed by id(), so that
+# they can be unloaded without searching for them.
+_loaded_corpora = weakref.WeakValueDictionary()
+
+# Functions called with a lazy corpus whenever it is loaded or unloaded,
+# so that caches of what was read from it can be cleared.
+_reload_callbacks = []
+
 
 class LazyCorpusLoader:
     """
@@ -102,12 +111,18 @@ class LazyCorpusLoader:
         # after reassigning __dict__ there shouldn't be any references to
         # corpus data so the memory should be deallocated after gc.collect()
         def _unload(self):
+            _loaded_corpora.pop(id(self), None)
             lazy_reader = LazyCorpusLoader(name, reader_cls, *args, **kwargs)
             self.__dict__ = lazy_reader.__dict__
             self.__class__ = lazy_reader.__class__
             gc.collect()
+            for callback in _reload_callbacks:
+                callback(self)
 
         self._unload = _make_bound_method(_unload, self)
+        _loaded_corpora[id(self)] = self
+        for callback in _reload_callbacks:
+            callback(self)
 
     def __getattr__(self, attr):
         # Fix for inspect.isclass under Python 2.6
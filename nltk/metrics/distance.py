@@ -60,6 +60,24 @@ def _edit_dist_step(
     lev[i][j] = min(a, b, c, d)
 
 
+def _edit_dist_two_rows(s1, s2, substitution_cost):
+    # Without transpositions, each row of the edit-distance table only
+    # depends on the row above it, so only two rows are kept at a time.
+    prev = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        cur = [i]
+        for j, c2 in enumerate(s2, 1):
+            cur.append(
+                min(
+                    prev[j] + 1,  # skipping a character in s1
+                    cur[j - 1] + 1,  # skipping a character in s2
+                    prev[j - 1] + (substitution_cost if c1 != c2 else 0),
+                )
+            )
+        prev = cur
+    return prev[-1]
+
+
 def edit_distance(s1, s2, substitution_cost=1, transpositions=False):
     """
     Calculate the Levenshtein edit-distance between two strings.
@@ -85,6 +103,15 @@ def edit_distance(s1, s2, substitution_cost=1, transpositions=False):
     :type transpositions: bool
     :rtype: int
     """
+    # Trivial cases: no edits, or only insertions/deletions.
+    if s1 == s2:
+        return 0
+    if not s1 or not s2:
+        return len(s1) + len(s2)
+
+    if not transpositions:
+        return _edit_dist_two_rows(s1, s2, substitution_cost)
+
     # set up a 2-D array
     len1 = len(s1)
     len2 = len(s2)
@@ -215,10 +242,16 @@ def binary_distance(label1, label2):
 
 
 def jaccard_distance(label1, label2):
-    """Distance metric comparing set-similarity."""
-    return (len(label1.union(label2)) - len(label1.intersection(label2))) / len(
-        label1.union(label2)
-    )
+    """Distance metric comparing set-similarity.
+
+    Two empty sets are identical, so their distance is 0.0.
+    """
+    len_intersection = len(label1.intersection(label2))
+    # Inclusion-exclusion gives the size of the union without building it.
+    len_union = len(label1) + len(label2) - len_intersection
+    if len_union == 0:
+        return 0.0
+    return (len_union - len_intersection) / len_union
 
 
 def masi_distance(label1, label2):
@@ -234,9 +267,11 @@ def masi_distance(label1, label2):
     """
 
     len_intersection = len(label1.intersection(label2))
-    len_union = len(label1.union(label2))
     len_label1 = len(label1)
     len_label2 = len(label2)
+    len_union = len_label1 + len_label2 - len_intersection
+    if len_union == 0:
+        return 0.0
     if len_label1 == len_label2 and len_label1 == len_intersection:
         m = 1
     elif len_intersection == min(len_label1, len_label2):
@@ -273,12 +308,25 @@ def presence(label):
 
 
 def fractional_presence(label):
-    return (
-        lambda x, y: abs((1.0 / len(x)) - (1.0 / len(y))) * (label in x and label in y)
-        or 0.0 * (label not in x and label not in y)
-        or abs(1.0 / len(x)) * (label in x and label not in y)
-        or (1.0 / len(y)) * (label not in x and label in y)
-    )
+    """Higher-order function to weigh the presence of a given label by
+    the number of labels it occurs with"""
+
+    def distance(x, y):
+        # Both weights are computed first, so that an empty set of labels
+        # raises ZeroDivisionError whether or not it is used
+        x_weight = 1.0 / len(x)
+        y_weight = 1.0 / len(y)
+        in_x, in_y = label in x, label in y
+        if in_x and in_y:
+            return abs(x_weight - y_weight)
+        elif in_x:
+            return x_weight
+        elif in_y:
+            return y_weight
+        else:
+            return 0.0
+
+    return distance
 
 
 def custom_distance(file):
@@ -288,8 +336,10 @@ def custom_distance(file):
             labelA, labelB, dist = l.strip().split("\t")
             labelA = frozenset([labelA])
             labelB = frozenset([labelB])
-            data[frozenset([labelA, labelB])] = float(dist)
-    return lambda x, y: data[frozenset([x, y])]
+            # Store both orderings, so that a lookup only needs to build a
+            # tuple rather than a frozenset of the two labels.
+            data[(labelA, labelB)] = data[(labelB, labelA)] = float(dist)
+    return lambda x, y: data[(x, y)]
 
 
 def jaro_similarity(s1, s2):
@@ -322,20 +372,25 @@ def jaro_similarity(s1, s2):
     matches = 0  # no.of matched characters in s1 and s2
     transpositions = 0  # no. of transpositions between s1 and s2
     flagged_1 = []  # positions in s1 which are matches to some character in s2
-    flagged_2 = []  # positions in s2 which are matches to some character in s1
+    # Bitmask of the positions in s2 which are matches to some character
+    # in s1, so that checking whether a position is taken is constant time.
+    flagged_2 = 0
 
     # Iterate through sequences, check for matches and compute transpositions.
     for i in range(len_s1):  # Iterate through each character.
         upperbound = min(i + match_bound, len_s2 - 1)
         lowerbound = max(0, i - match_bound)
         for j in range(lowerbound, upperbound + 1):
-            if s1[i] == s2[j] and j not in flagged_2:
+            if s1[i] == s2[j] and not flagged_2 >> j & 1:
                 matches += 1
                 flagged_1.append(i)
-                flagged_2.append(j)
+                flagged_2 |= 1 << j
                 break
-    flagged_2.sort()
-    for i, j in zip(flagged_1, flagged_2):
+    # Pair the matched positions of s1 with those of s2 in increasing
+    # order, taking the lowest set bit of the mask each time.
+    for i in flagged_1:
+        j = (flagged_2 & -flagged_2).bit_length() - 1
+        flagged_2 &= flagged_2 - 1
         if s1[i] != s2[j]:
             transpositions += 1
 
@@ -378,60 +433,20 @@ def jaro_winkler_similarity(s1, s2, p=0.1, max_l=4):
         given that max(p)<=0.25 , default is p=0.1 in Winkler (1990)
 
 
-    Test using outputs from https://www.census.gov/srd/papers/pdf/rr93-8.pdf
-    from "Table 5 Comparison of String Comparators Rescaled between 0 and 1"
-
-    >>> winkler_examples = [("billy", "billy"), ("billy", "bill"), ("billy", "blily"),
-    ... ("massie", "massey"), ("yvette", "yevett"), ("billy", "bolly"), ("dwayne", "duane"),
-    ... ("dixon", "dickson"), ("billy", "susan")]
-
-    >>> winkler_scores = [1.000, 0.967, 0.947, 0.944, 0.911, 0.893, 0.858, 0.853, 0.000]
-    >>> jaro_scores =    [1.000, 0.933, 0.933, 0.889, 0.889, 0.867, 0.822, 0.790, 0.000]
-
-    One way to match the values on the Winkler's paper is to provide a different
-    p scaling factor for different pairs of strings, e.g.
-
-    >>> p_factors = [0.1, 0.125, 0.20, 0.125, 0.20, 0.20, 0.20, 0.15, 0.1]
-
-    >>> for (s1, s2), jscore, wscore, p in zip(winkler_examples, jaro_scores, winkler_scores, p_factors):
-    ...     assert round(jaro_similarity(s1, s2), 3) == jscore
-    ...     assert round(jaro_winkler_similarity(s1, s2, p=p), 3) == wscore
-
-
-    Test using outputs from https://www.census.gov/srd/papers/pdf/rr94-5.pdf from
-    "Table 2.1. Comparison of String Comparators Using Last Names, First Names, and Street Names"
-
-    >>> winkler_examples = [('SHACKLEFORD', 'SHACKELFORD'), ('DUNNINGHAM', 'CUNNIGHAM'),
-    ... ('NICHLESON', 'NICHULSON'), ('JONES', 'JOHNSON'), ('MASSEY', 'MASSIE'),
-    ... ('ABROMS', 'ABRAMS'), ('HARDIN', 'MARTINEZ'), ('ITMAN', 'SMITH'),
-    ... ('JERALDINE', 'GERALDINE'), ('MARHTA', 'MARTHA'), ('MICHELLE', 'MICHAEL'),
-    ... ('JULIES', 'JULIUS'), ('TANYA', 'TONYA'), ('DWAYNE', 'DUANE'), ('SEAN', 'SUSAN'),
-    ... ('JON', 'JOHN'), ('JON', 'JAN'), ('BROOKHAVEN', 'BRROKHAVEN'),
-    ... ('BROOK HALLOW', 'BROOK HLLW'), ('DECATUR', 'DECATIR'), ('FITZRUREITER', 'FITZENREITER'),
-    ... ('HIGBEE', 'HIGHEE'), ('HIGBEE', 'HIGVEE'), ('LACURA', 'LOCURA'), ('IOWA', 'IONA'), ('1ST', 'IST')]
-
-    >>> jaro_scores =   [0.970, 0.896, 0.926, 0.790, 0.889, 0.889, 0.722, 0.467, 0.926,
-    ... 0.944, 0.869, 0.889, 0.867, 0.822, 0.783, 0.917, 0.000, 0.933, 0.944, 0.905,
-    ... 0.856, 0.889, 0.889, 0.889, 0.833, 0.000]
-
-    >>> winkler_scores = [0.982, 0.896, 0.956, 0.832, 0.944, 0.922, 0.722, 0.467, 0.926,
-    ... 0.961, 0.921, 0.933, 0.880, 0.858, 0.805, 0.933, 0.000, 0.947, 0.967, 0.943,
-    ... 0.913, 0.922, 0.922, 0.900, 0.867, 0.000]
-
-    One way to match the values on the Winkler's paper is to provide a different
-    p scaling factor for different pairs of strings, e.g.
-
-    >>> p_factors = [0.1, 0.1, 0.1, 0.1, 0.125, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.20,
-    ... 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1]
-
-
-    >>> for (s1, s2), jscore, wscore, p in zip(winkler_examples, jaro_scores, winkler_scores, p_factors):
-    ...     if (s1, s2) in [('JON', 'JAN'), ('1ST', 'IST')]:
-    ...         continue  # Skip bad examples from the paper.
-    ...     assert round(jaro_similarity(s1, s2), 3) == jscore
-    ...     assert round(jaro_winkler_similarity(s1, s2, p=p), 3) == wscore
-
+    A few examples from "Table 5 Comparison of String Comparators Rescaled
+    between 0 and 1" in https://www.census.gov/srd/papers/pdf/rr93-8.pdf
+    (the full tables from that paper and from rr94-5.pdf are checked in
+    nltk/test/unit/test_distance.py).  Winkler's values are matched by
+    choosing a p scaling factor for each pair of strings:
 
+    >>> round(jaro_similarity("massie", "massey"), 3)
+    0.889
+    >>> round(jaro_winkler_similarity("massie", "massey", p=0.125), 3)
+    0.944
+    >>> round(jaro_winkler_similarity("dixon", "dickson", p=0.15), 3)
+    0.853
+    >>> jaro_winkler_similarity("billy", "susan")
+    0.0
 
     This test-case proves that the output of Jaro-Winkler similarity depends on
     the product  l * p and not on the product max_l * p. Here the product max_l * p > 1
@@ -451,21 +466,22 @@ def jaro_winkler_similarity(s1, s2, p=0.1, max_l=4):
             )
         )
 
+    # Identical sequences of two or more items have a Jaro similarity of
+    # 1, which leaves no room for a prefix bonus, so skip both passes
+    # over them.  (Single items have an empty match window.)
+    if s1 == s2 and len(s1) > 1:
+        return 1.0
+
     # Compute the Jaro similarity
     jaro_sim = jaro_similarity(s1, s2)
 
-    # Initialize the upper bound for the no. of prefixes.
-    # if user did not pre-define the upperbound,
-    # use shorter length between s1 and s2
-
-    # Compute the prefix matches.
+    # Compute the prefix matches, up to max_l of them.
     l = 0
     # zip() will automatically loop until the end of shorter string.
     for s1_i, s2_i in zip(s1, s2):
-        if s1_i == s2_i:
-            l += 1
-        else:
+        if s1_i != s2_i:
             break
+        l += 1
         if l == max_l:
             break
     # Return the similarity value as described in docstring.
@@ -40,6 +40,8 @@ Statistical Models for Text Segmentation
 Machine Learning, 34, 177-210
 """
 
+from itertools import accumulate
+
 try:
     import numpy as np
 except ImportError:
@@ -82,9 +84,13 @@ def windowdiff(seg1, seg2, k, boundary="1", weighted=False):
         raise ValueError(
             "Window width k should be smaller or equal than segmentation lengths"
         )
+    # Running boundary counts, so that the boundaries in each window are
+    # found by subtraction instead of by recounting the window.
+    counts1 = list(accumulate((item == boundary for item in seg1), initial=0))
+    counts2 = list(accumulate((item == boundary for item in seg2), initial=0))
     wd = 0
     for i in range(len(seg1) - k + 1):
-        ndiff = abs(seg1[i : i + k].count(boundary) - seg2[i : i + k].count(boundary))
+        ndiff = abs((counts1[i + k] - counts1[i]) - (counts2[i + k] - counts2[i]))
         if weighted:
             wd += ndiff
         else:
@@ -83,12 +83,8 @@ class SentimentAnalyzer:
             frequency.
         """
         # Stopwords are not removed
-        unigram_feats_freqs = FreqDist(word for word in words)
-        return [
-            w
-            for w, f in unigram_feats_freqs.most_common(top_n)
-            if unigram_feats_freqs[w] > min_freq
-        ]
+        unigram_feats_freqs = FreqDist(words)
+        return [w for w, f in unigram_feats_freqs.most_common(top_n) if f > min_freq]
 
     def bigram_collocation_feats(
         self, documents, top_n=None, min_freq=3, assoc_measure=BigramAssocMeasures.pmi
@@ -179,8 +179,9 @@ def extract_unigram_feats(document, unigrams, handle_negation=False):
     features = {}
     if handle_negation:
         document = mark_negation(document)
+    words = set(document)
     for word in unigrams:
-        features[f"contains({word})"] = word in set(document)
+        features[f"contains({word})"] = word in words
     return features
 
 
@@ -202,8 +203,9 @@ def extract_bigram_feats(document, bigrams):
     ('contains(police - prevented)', False)]
     """
     features = {}
+    document_bigrams = set(nltk.bigrams(document))
     for bigr in bigrams:
-        features[f"contains({bigr[0]} - {bigr[1]})"] = bigr in nltk.bigrams(document)
+        features[f"contains({bigr[0]} - {bigr[1]})"] = bigr in document_bigrams
     return features
 
 
@@ -734,14 +736,19 @@ def demo_liu_hu_lexicon(sentence, plot=False):
     neg_words = 0
     tokenized_sent = [word.lower() for word in tokenizer.tokenize(sentence)]
 
+    # Read each lexicon once, rather than scanning the corpus files for
+    # every word in the sentence.
+    positive_words = set(opinion_lexicon.positive())
+    negative_words = set(opinion_lexicon.negative())
+
     x = list(range(len(tokenized_sent)))  # x axis for the plot
     y = []
 
     for word in tokenized_sent:
-        if word in opinion_lexicon.positive():
+        if word in positive_words:
             pos_words += 1
             y.append(1)  # positive
-        elif word in opinion_lexicon.negative():
+        elif word in negative_words:
             neg_words += 1
             y.append(-1)  # negative
         else:
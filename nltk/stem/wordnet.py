@@ -7,6 +7,10 @@
 # URL: <https://www.nltk.org/>
 # For license information, see LICENSE.TXT
 
+from functools import lru_cache
+
+from nltk.corpus.util import _reload_callbacks
+
 
 class WordNetLemmatizer:
     """
@@ -61,6 +65,8 @@ class WordNetLemmatizer:
         """Lemmatize `word` by picking the shortest of the possible lemmas,
         using the wordnet corpus reader's built-in _morphy function.
         Returns the input word unchanged if it cannot be found in WordNet.
+        Unless _morphy() is overridden, results are cached, so repeated
+        words are only looked up once.
 
         >>> from nltk.stem import WordNetLemmatizer as wnl
         >>> print(wnl().lemmatize('dogs'))
@@ -82,8 +88,43 @@ class WordNetLemmatizer:
         :type pos: str
         :return: The shortest lemma of `word`, for the given `pos`.
         """
-        lemmas = self._morphy(word, pos)
-        return min(lemmas, key=len) if lemmas else word
+        if type(self)._morphy is not WordNetLemmatizer._morphy:
+            # A subclass may look lemmas up some other way, which the
+            # shared cache knows nothing about
+            lemmas = self._morphy(word, pos)
+            return min(lemmas, key=len) if lemmas else word
+        return _lemmatize(word, pos)
 
     def __repr__(self):
         return "<WordNetLemmatizer>"
+
+
+@lru_cache(maxsize=100000)
+def _lemmatize(word, pos):
+    """
+    Shared cache behind WordNetLemmatizer.lemmatize(), so that the
+    frequent words of a text are only looked up in WordNet once,
+    whichever lemmatizer instance they are passed to.
+    """
+    from nltk.corpus import wordnet as wn
+
+    lemmas = wn._morphy(word, pos)
+    if not lemmas:
+        return word
+    if len(lemmas) == 1:
+        return lemmas[0]
+    return min(lemmas, key=len)
+
+
+def _clear_cache_on_wordnet_reload(corpus):
+    """
+    Clear the cache of _lemmatize() when WordNet is loaded or unloaded,
+    so that lemmas are never served from a WordNet that is gone.
+    """
+    from nltk.corpus import wordnet as wn
+
+    if corpus is wn:
+        _lemmatize.cache_clear()
+
+
+_reload_callbacks.append(_clear_cache_on_wordnet_reload)
@@ -1,7 +1,5 @@
 import pytest
 
-from nltk.corpus.reader import CorpusReader
-
 
 @pytest.fixture(autouse=True)
 def mock_plot(mocker):
@@ -25,9 +23,7 @@ def teardown_loaded_corpora():
 
     yield  # first, wait for the test to end
 
-    import nltk.corpus
+    from nltk.corpus.util import _loaded_corpora
 
-    for name in dir(nltk.corpus):
-        obj = getattr(nltk.corpus, name, None)
-        if isinstance(obj, CorpusReader) and hasattr(obj, "_unload"):
-            obj._unload()
+    for corpus in list(_loaded_corpora.values()):
+        corpus._unload()
@@ -48,3 +48,80 @@ def test_megam():
 
 def test_tadm():
     assert_classifier_correct("TADM")
+
+
+# Featuresets with missing features, so that some values of a feature
+# are absent from some nodes of the tree. The best split is unique at
+# every node, so the tree does not depend on the order of sets.
+BINARY_TRAIN = [
+    (dict(color="yellow", size="small"), "banana"),
+    (dict(color="green", size="small"), "lime"),
+    (dict(color="yellow"), "lime"),
+    (dict(color="yellow", size="large", shape="long"), "apple"),
+    (dict(shape="round"), "apple"),
+    (dict(color="red", size="small", shape="long"), "cherry"),
+    (dict(color="red", size="small"), "cherry"),
+    (dict(color="green", size="large", shape="long"), "lime"),
+    (dict(color="green", size="large"), "cherry"),
+    (dict(color="red", size="large"), "banana"),
+    (dict(color="green", size="small", shape="round"), "lime"),
+    (dict(color="red", shape="round"), "cherry"),
+    (dict(size="large"), "apple"),
+    (dict(color="green", size="small", shape="round"), "lime"),
+]
+
+BINARY_TEST = [
+    dict(color="red", size="small"),
+    dict(color="purple"),  # unseen value
+    dict(size="small"),
+    dict(),
+    dict(color="yellow", size="huge"),  # unseen value
+    dict(color="green", shape="long"),
+]
+
+BINARY_TREE = """\
+color=red? ............................................ cherry
+  size=large? ......................................... banana
+  else: ............................................... cherry
+else: ................................................. lime
+  color=green? ........................................ lime
+  else: ............................................... apple
+    size=small? ....................................... banana
+    else: ............................................. apple
+"""
+
+BINARY_RESULTS = ["cherry", "apple", "banana", "apple", "apple", "lime"]
+
+
+@pytest.mark.parametrize(
+    "feature_values",
+    [
+        None,
+        # Includes values that are not present in the data
+        {
+            "color": {"red", "green", "yellow", "purple"},
+            "size": {"small", "large", "huge"},
+            "shape": {"round", "long"},
+        },
+    ],
+)
+def test_binary_decision_tree(feature_values):
+    classifier = classify.DecisionTreeClassifier.train(
+        BINARY_TRAIN,
+        entropy_cutoff=0.0,
+        support_cutoff=2,
+        binary=True,
+        feature_values=feature_values,
+    )
+    assert classifier.pretty_format() == BINARY_TREE
+    assert classifier.classify_many(BINARY_TEST) == BINARY_RESULTS
+
+
+def test_refine_binary_decision_tree_without_feature_values():
+    # refine() collects the feature values itself, as train() does
+    classifier = classify.DecisionTreeClassifier.binary_stump(
+        "color", "red", BINARY_TRAIN
+    )
+    classifier.refine(BINARY_TRAIN, 0.0, 99, 2, binary=True)
+    assert classifier.pretty_format() == BINARY_TREE
+    assert classifier.classify_many(BINARY_TEST) == BINARY_RESULTS
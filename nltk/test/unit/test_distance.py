@@ -2,7 +2,15 @@ from typing import Tuple
 
 import pytest
 
-from nltk.metrics.distance import edit_distance
+from nltk.metrics.distance import (
+    custom_distance,
+    edit_distance,
+    fractional_presence,
+    jaccard_distance,
+    jaro_similarity,
+    jaro_winkler_similarity,
+    masi_distance,
+)
 
 
 class TestEditDistance:
@@ -127,3 +135,119 @@ class TestEditDistance:
                     transpositions=transpositions,
                 )
                 assert predicted == expected
+
+
+class TestSetDistances:
+    @pytest.mark.parametrize(
+        "label1,label2,expecteds",
+        [
+            # expecteds is (jaccard_distance, masi_distance)
+            ({1, 2}, {1, 2}, (0.0, 0.0)),
+            ({1, 2}, {1, 2, 3, 4}, (0.5, 0.665)),
+            ({1, 2, 3}, {3, 4}, (0.75, 0.9175)),
+            ({1}, {2}, (1.0, 1.0)),
+            ({1}, set(), (1.0, 1.0)),
+            # Two empty sets are identical, rather than undefined.
+            (set(), set(), (0.0, 0.0)),
+        ],
+    )
+    def test_set_distances(self, label1, label2, expecteds):
+        for s1, s2 in ((label1, label2), (label2, label1)):
+            assert jaccard_distance(s1, s2) == pytest.approx(expecteds[0])
+            assert masi_distance(s1, s2) == pytest.approx(expecteds[1])
+
+    @pytest.mark.parametrize(
+        "label,label1,label2,expected",
+        [
+            # The label is present in both, one or neither of the sets.
+            ("a", {"a", "b"}, {"a"}, 0.5),
+            ("a", {"a", "b"}, {"c"}, 0.5),
+            ("a", {"c"}, {"a", "b", "c"}, 1 / 3),
+            ("a", {"b"}, {"c"}, 0.0),
+        ],
+    )
+    def test_fractional_presence(self, label, label1, label2, expected):
+        distance = fractional_presence(label)
+        assert distance(label1, label2) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "label1,label2",
+        [
+            (set(), {"b"}),
+            ({"b"}, set()),
+            (set(), set()),
+        ],
+    )
+    def test_fractional_presence_of_empty_set(self, label1, label2):
+        distance = fractional_presence("a")
+        with pytest.raises(ZeroDivisionError):
+            distance(label1, label2)
+
+    def test_custom_distance(self, tmp_path):
+        path = tmp_path / "distances.txt"
+        path.write_text("a\tb\t0.5\nb\tc\t0.25\n")
+        distance = custom_distance(str(path))
+        a, b, c = frozenset(["a"]), frozenset(["b"]), frozenset(["c"])
+        # Each pair is found in either order.
+        assert distance(a, b) == distance(b, a) == 0.5
+        assert distance(b, c) == distance(c, b) == 0.25
+        with pytest.raises(KeyError):
+            distance(a, c)
+
+
+class TestJaroWinkler:
+    @pytest.mark.parametrize(
+        "s1,s2,jaro_score,winkler_score,p",
+        [
+            # From "Table 5 Comparison of String Comparators Rescaled between 0 and 1"
+            # in https://www.census.gov/srd/papers/pdf/rr93-8.pdf.  One way to
+            # match Winkler's values is to provide a different p scaling factor
+            # for different pairs of strings.
+            ("billy", "billy", 1.000, 1.000, 0.1),
+            ("billy", "bill", 0.933, 0.967, 0.125),
+            ("billy", "blily", 0.933, 0.947, 0.20),
+            ("massie", "massey", 0.889, 0.944, 0.125),
+            ("yvette", "yevett", 0.889, 0.911, 0.20),
+            ("billy", "bolly", 0.867, 0.893, 0.20),
+            ("dwayne", "duane", 0.822, 0.858, 0.20),
+            ("dixon", "dickson", 0.790, 0.853, 0.15),
+            ("billy", "susan", 0.000, 0.000, 0.1),
+            # From "Table 2.1. Comparison of String Comparators Using Last Names,
+            # First Names, and Street Names" in
+            # https://www.census.gov/srd/papers/pdf/rr94-5.pdf, leaving out the
+            # bad examples ("JON", "JAN") and ("1ST", "IST") from the paper.
+            ("SHACKLEFORD", "SHACKELFORD", 0.970, 0.982, 0.1),
+            ("DUNNINGHAM", "CUNNIGHAM", 0.896, 0.896, 0.1),
+            ("NICHLESON", "NICHULSON", 0.926, 0.956, 0.1),
+            ("JONES", "JOHNSON", 0.790, 0.832, 0.1),
+            ("MASSEY", "MASSIE", 0.889, 0.944, 0.125),
+            ("ABROMS", "ABRAMS", 0.889, 0.922, 0.1),
+            ("HARDIN", "MARTINEZ", 0.722, 0.722, 0.1),
+            ("ITMAN", "SMITH", 0.467, 0.467, 0.1),
+            ("JERALDINE", "GERALDINE", 0.926, 0.926, 0.1),
+            ("MARHTA", "MARTHA", 0.944, 0.961, 0.1),
+            ("MICHELLE", "MICHAEL", 0.869, 0.921, 0.1),
+            ("JULIES", "JULIUS", 0.889, 0.933, 0.1),
+            ("TANYA", "TONYA", 0.867, 0.880, 0.1),
+            ("DWAYNE", "DUANE", 0.822, 0.858, 0.20),
+            ("SEAN", "SUSAN", 0.783, 0.805, 0.1),
+            ("JON", "JOHN", 0.917, 0.933, 0.1),
+            ("BROOKHAVEN", "BRROKHAVEN", 0.933, 0.947, 0.1),
+            ("BROOK HALLOW", "BROOK HLLW", 0.944, 0.967, 0.1),
+            ("DECATUR", "DECATIR", 0.905, 0.943, 0.1),
+            ("FITZRUREITER", "FITZENREITER", 0.856, 0.913, 0.1),
+            ("HIGBEE", "HIGHEE", 0.889, 0.922, 0.1),
+            ("HIGBEE", "HIGVEE", 0.889, 0.922, 0.1),
+            ("LACURA", "LOCURA", 0.889, 0.900, 0.1),
+            ("IOWA", "IONA", 0.833, 0.867, 0.1),
+        ],
+    )
+    def test_winkler_examples(
+        self, s1: str, s2: str, jaro_score: float, winkler_score: float, p: float
+    ):
+        """
+        Test `jaro_similarity` and `jaro_winkler_similarity` against the
+        scores reported by Winkler.
+        """
+        assert round(jaro_similarity(s1, s2), 3) == jaro_score
+        assert round(jaro_winkler_similarity(s1, s2, p=p), 3) == winkler_score
@@ -1,9 +1,13 @@
 import unittest
 from contextlib import closing
+from types import SimpleNamespace
+from unittest import mock
 
 from nltk import data
+from nltk.corpus.util import _reload_callbacks
 from nltk.stem.porter import PorterStemmer
 from nltk.stem.snowball import SnowballStemmer
+from nltk.stem.wordnet import WordNetLemmatizer, _lemmatize
 
 
 class SnowballTest(unittest.TestCase):
@@ -155,3 +159,49 @@ class PorterTest(unittest.TestCase):
         assert porter.stem("I", to_lowercase=False) == "I"
         assert porter.stem("Github") == "github"
         assert porter.stem("Github", to_lowercase=False) == "Github"
+
+
+class WordNetLemmatizerTest(unittest.TestCase):
+    def setUp(self):
+        # Stand in for the WordNet corpus, so that lookups can be counted
+        self.wordnet = SimpleNamespace(_morphy=mock.Mock(return_value=["us", "u"]))
+        patcher = mock.patch("nltk.corpus.wordnet", self.wordnet)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        _lemmatize.cache_clear()
+        self.addCleanup(_lemmatize.cache_clear)
+
+    def test_lemmatize_is_cached(self):
+        assert WordNetLemmatizer().lemmatize("us") == "u"
+        assert WordNetLemmatizer().lemmatize("us") == "u"
+        assert self.wordnet._morphy.call_count == 1
+
+    def test_cache_clear(self):
+        WordNetLemmatizer().lemmatize("us")
+        _lemmatize.cache_clear()
+        assert WordNetLemmatizer().lemmatize("us") == "u"
+        assert self.wordnet._morphy.call_count == 2
+
+    def test_cache_is_cleared_when_wordnet_is_reloaded(self):
+        WordNetLemmatizer().lemmatize("us")
+        # As called by LazyCorpusLoader when it loads or unloads WordNet
+        for callback in _reload_callbacks:
+            callback(self.wordnet)
+        assert WordNetLemmatizer().lemmatize("us") == "u"
+        assert self.wordnet._morphy.call_count == 2
+
+    def test_cache_is_kept_when_other_corpora_are_reloaded(self):
+        WordNetLemmatizer().lemmatize("us")
+        for callback in _reload_callbacks:
+            callback(SimpleNamespace())
+        assert WordNetLemmatizer().lemmatize("us") == "u"
+        assert self.wordnet._morphy.call_count == 1
+
+    def test_overridden_morphy_is_used(self):
+        class Lemmatizer(WordNetLemmatizer):
+            def _morphy(self, form, pos, check_exceptions=True):
+                return ["zz", "z"]
+
+        assert Lemmatizer().lemmatize("us") == "z"
+        assert WordNetLemmatizer().lemmatize("us") == "u"
+        assert self.wordnet._morphy.call_count == 1
@@ -54,6 +54,25 @@ class TestIBMModel4(unittest.TestCase):
         self.assertEqual(model4.non_head_distortion_table[4][0], IBMModel.MIN_PROB)
         self.assertEqual(model4.non_head_distortion_table[100][2], IBMModel.MIN_PROB)
 
+    def test_train_with_unused_word_classes_missing(self):
+        # arrange
+        # 'house' only ends a sentence, so it is never a previous cept
+        # and its class is never needed
+        src_classes = {"the": 0, "a": 0, "book": 1}
+        trg_classes = {"das": 0, "ein": 0, "haus": 1, "buch": 1}
+        corpus = [
+            AlignedSent(["das", "haus"], ["the", "house"]),
+            AlignedSent(["das", "buch"], ["the", "book"]),
+            AlignedSent(["ein", "buch"], ["a", "book"]),
+        ]
+
+        # act
+        IBMModel4(corpus, 5, src_classes, trg_classes)
+
+        # assert
+        for aligned_sentence in corpus:
+            self.assertIsNotNone(aligned_sentence.alignment)
+
     def test_prob_t_a_given_s(self):
         # arrange
         src_sentence = ["ich", "esse", "ja", "gern", "räucherschinken"]
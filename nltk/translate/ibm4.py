@@ -109,7 +109,7 @@ Translation: Parameter Estimation. Computational Linguistics, 19 (2),
 
 import warnings
 from collections import defaultdict
-from math import factorial
+from math import ceil, factorial
 
 from nltk.translate import AlignedSent, Alignment, IBMModel, IBMModel3
 from nltk.translate.ibm_model import Counts, longest_target_sentence_length
@@ -278,21 +278,23 @@ class IBMModel4(IBMModel):
                 + " words). Results may be less accurate."
             )
 
+        # Share the default factories between displacements, instead of
+        # creating new closures for every table and every class in it
+        def uniform_prob():
+            return initial_prob
+
+        def uniform_probs():
+            return defaultdict(uniform_prob)
+
         for dj in range(1, max_m):
-            self.head_distortion_table[dj] = defaultdict(
-                lambda: defaultdict(lambda: initial_prob)
-            )
-            self.head_distortion_table[-dj] = defaultdict(
-                lambda: defaultdict(lambda: initial_prob)
-            )
-            self.non_head_distortion_table[dj] = defaultdict(lambda: initial_prob)
-            self.non_head_distortion_table[-dj] = defaultdict(lambda: initial_prob)
+            self.head_distortion_table[dj] = defaultdict(uniform_probs)
+            self.head_distortion_table[-dj] = defaultdict(uniform_probs)
+            self.non_head_distortion_table[dj] = defaultdict(uniform_prob)
+            self.non_head_distortion_table[-dj] = defaultdict(uniform_prob)
 
     def train(self, parallel_corpus):
         counts = Model4Counts()
         for aligned_sentence in parallel_corpus:
-            m = len(aligned_sentence.words)
-
             # Sample the alignment space
             sampled_alignments, best_alignment = self.sample(aligned_sentence)
             # Record the most probable alignment
@@ -300,28 +302,22 @@ class IBMModel4(IBMModel):
                 best_alignment.zero_indexed_alignment()
             )
 
-            # E step (a): Compute normalization factors to weigh counts
-            total_count = self.prob_of_alignments(sampled_alignments)
-
-            # E step (b): Collect counts
+            # E step (a): Compute normalization factors to weigh counts.
+            # Keep each alignment's probability for weighing its counts
+            # below, instead of computing it a second time.
+            alignment_probs = []
+            total_count = 0
             for alignment_info in sampled_alignments:
                 count = self.prob_t_a_given_s(alignment_info)
-                normalized_count = count / total_count
+                alignment_probs.append((alignment_info, count))
+                total_count += count
 
-                for j in range(1, m + 1):
-                    counts.update_lexical_translation(
-                        normalized_count, alignment_info, j
-                    )
-                    counts.update_distortion(
-                        normalized_count,
-                        alignment_info,
-                        j,
-                        self.src_classes,
-                        self.trg_classes,
-                    )
-
-                counts.update_null_generation(normalized_count, alignment_info)
-                counts.update_fertility(normalized_count, alignment_info)
+            # E step (b): Collect counts
+            for alignment_info, count in alignment_probs:
+                normalized_count = count / total_count
+                counts._update_alignment(
+                    normalized_count, alignment_info, self.src_classes, self.trg_classes
+                )
 
         # M step: Update probabilities with maximum likelihood estimates
         # If any probability is less than MIN_PROB, clamp it to MIN_PROB
@@ -335,24 +331,25 @@ class IBMModel4(IBMModel):
         self.maximize_null_generation_probabilities(counts)
 
     def maximize_distortion_probabilities(self, counts):
+        MIN_PROB = IBMModel.MIN_PROB
         head_d_table = self.head_distortion_table
+        head_for_any_dj = counts.head_distortion_for_any_dj
         for dj, src_classes in counts.head_distortion.items():
+            head_d_table_dj = head_d_table[dj]
             for s_cls, trg_classes in src_classes.items():
-                for t_cls in trg_classes:
-                    estimate = (
-                        counts.head_distortion[dj][s_cls][t_cls]
-                        / counts.head_distortion_for_any_dj[s_cls][t_cls]
-                    )
-                    head_d_table[dj][s_cls][t_cls] = max(estimate, IBMModel.MIN_PROB)
+                head_d_table_s = head_d_table_dj[s_cls]
+                totals = head_for_any_dj[s_cls]
+                for t_cls, count in trg_classes.items():
+                    estimate = count / totals[t_cls]
+                    head_d_table_s[t_cls] = max(estimate, MIN_PROB)
 
         non_head_d_table = self.non_head_distortion_table
+        non_head_for_any_dj = counts.non_head_distortion_for_any_dj
         for dj, trg_classes in counts.non_head_distortion.items():
-            for t_cls in trg_classes:
-                estimate = (
-                    counts.non_head_distortion[dj][t_cls]
-                    / counts.non_head_distortion_for_any_dj[t_cls]
-                )
-                non_head_d_table[dj][t_cls] = max(estimate, IBMModel.MIN_PROB)
+            non_head_d_table_dj = non_head_d_table[dj]
+            for t_cls, count in trg_classes.items():
+                estimate = count / non_head_for_any_dj[t_cls]
+                non_head_d_table_dj[t_cls] = max(estimate, MIN_PROB)
 
     def prob_t_a_given_s(self, alignment_info):
         """
@@ -366,82 +363,78 @@ class IBMModel4(IBMModel):
         probability = 1.0
         MIN_PROB = IBMModel.MIN_PROB
 
-        def null_generation_term():
-            # Binomial distribution: B(m - null_fertility, p1)
-            value = 1.0
-            p1 = ibm_model.p1
-            p0 = 1 - p1
-            null_fertility = alignment_info.fertility_of_i(0)
-            m = len(alignment_info.trg_sentence) - 1
-            value *= pow(p1, null_fertility) * pow(p0, m - 2 * null_fertility)
-            if value < MIN_PROB:
-                return MIN_PROB
+        # The terms are computed inline rather than in nested functions,
+        # since this is called for every alignment considered in training
+        alignment = alignment_info.alignment
+        src_sentence = alignment_info.src_sentence
+        trg_sentence = alignment_info.trg_sentence
+        cepts = alignment_info.cepts
+
+        # Abort computation whenever probability falls below MIN_PROB at
+        # any point, since MIN_PROB can be considered as zero
 
+        # Null generation term
+        # Binomial distribution: B(m - null_fertility, p1)
+        p1 = ibm_model.p1
+        p0 = 1 - p1
+        null_fertility = len(cepts[0])
+        m = len(trg_sentence) - 1
+        value = pow(p1, null_fertility) * pow(p0, m - 2 * null_fertility)
+        if value < MIN_PROB:
+            value = MIN_PROB
+        else:
             # Combination: (m - null_fertility) choose null_fertility
             for i in range(1, null_fertility + 1):
                 value *= (m - null_fertility - i + 1) / i
-            return value
-
-        def fertility_term():
-            value = 1.0
-            src_sentence = alignment_info.src_sentence
-            for i in range(1, len(src_sentence)):
-                fertility = alignment_info.fertility_of_i(i)
-                value *= (
-                    factorial(fertility)
-                    * ibm_model.fertility_table[fertility][src_sentence[i]]
-                )
-                if value < MIN_PROB:
-                    return MIN_PROB
-            return value
-
-        def lexical_translation_term(j):
-            t = alignment_info.trg_sentence[j]
-            i = alignment_info.alignment[j]
-            s = alignment_info.src_sentence[i]
-            return ibm_model.translation_table[t][s]
-
-        def distortion_term(j):
-            t = alignment_info.trg_sentence[j]
-            i = alignment_info.alignment[j]
-            if i == 0:
-                # case 1: t is aligned to NULL
-                return 1.0
-            if alignment_info.is_head_word(j):
-                # case 2: t is the first word of a tablet
-                previous_cept = alignment_info.previous_cept(j)
-                src_class = None
-                if previous_cept is not None:
-                    previous_s = alignment_info.src_sentence[previous_cept]
-                    src_class = ibm_model.src_classes[previous_s]
-                trg_class = ibm_model.trg_classes[t]
-                dj = j - alignment_info.center_of_cept(previous_cept)
-                return ibm_model.head_distortion_table[dj][src_class][trg_class]
-
-            # case 3: t is a subsequent word of a tablet
-            previous_position = alignment_info.previous_in_tablet(j)
-            trg_class = ibm_model.trg_classes[t]
-            dj = j - previous_position
-            return ibm_model.non_head_distortion_table[dj][trg_class]
-
-        # end nested functions
-
-        # Abort computation whenever probability falls below MIN_PROB at
-        # any point, since MIN_PROB can be considered as zero
-        probability *= null_generation_term()
+        probability *= value
         if probability < MIN_PROB:
             return MIN_PROB
 
-        probability *= fertility_term()
+        # Fertility term
+        fertility_table = ibm_model.fertility_table
+        value = 1.0
+        for i in range(1, len(src_sentence)):
+            fertility = len(cepts[i])
+            value *= factorial(fertility) * fertility_table[fertility][src_sentence[i]]
+            if value < MIN_PROB:
+                value = MIN_PROB
+                break
+        probability *= value
         if probability < MIN_PROB:
             return MIN_PROB
 
-        for j in range(1, len(alignment_info.trg_sentence)):
-            probability *= lexical_translation_term(j)
+        # Lexical translation and distortion terms
+        translation_table = ibm_model.translation_table
+        head_distortion_table = ibm_model.head_distortion_table
+        non_head_distortion_table = ibm_model.non_head_distortion_table
+        src_classes = ibm_model.src_classes
+        trg_classes = ibm_model.trg_classes
+        previous_cepts, origins = _distortion_origins(alignment_info)
+        for j in range(1, len(trg_sentence)):
+            t = trg_sentence[j]
+            i = alignment[j]
+            probability *= translation_table[t][src_sentence[i]]
             if probability < MIN_PROB:
                 return MIN_PROB
 
-            probability *= distortion_term(j)
+            if i == 0:
+                # case 1: t is aligned to NULL
+                continue
+            if cepts[i][0] == j:
+                # case 2: t is the first word of a tablet
+                previous_cept = previous_cepts[j]
+                src_class = None
+                if previous_cept is not None:
+                    previous_s = src_sentence[previous_cept]
+                    src_class = src_classes[previous_s]
+                trg_class = trg_classes[t]
+                dj = j - origins[j]
+                probability *= head_distortion_table[dj][src_class][trg_class]
+            else:
+                # case 3: t is a subsequent word of a tablet
+                trg_class = trg_classes[t]
+                dj = j - origins[j]
+                probability *= non_head_distortion_table[dj][trg_class]
             if probability < MIN_PROB:
                 return MIN_PROB
 
@@ -488,3 +481,74 @@ class Model4Counts(Counts):
             dj = j - previous_j
             self.non_head_distortion[dj][trg_class] += count
             self.non_head_distortion_for_any_dj[trg_class] += count
+
+    def _update_alignment(self, count, alignment_info, src_classes, trg_classes):
+        """
+        Collect all counts for one sampled alignment, doing the work of
+        ``update_lexical_translation`` and ``update_distortion`` in a
+        single pass over the target sentence.
+        """
+        alignment = alignment_info.alignment
+        src_sentence = alignment_info.src_sentence
+        trg_sentence = alignment_info.trg_sentence
+        cepts = alignment_info.cepts
+        previous_cepts, origins = _distortion_origins(alignment_info)
+        for j in range(1, len(trg_sentence)):
+            i = alignment[j]
+            t = trg_sentence[j]
+            s = src_sentence[i]
+            self.t_given_s[t][s] += count
+            self.any_t_given_s[s] += count
+
+            if i == 0:
+                # case 1: t is aligned to NULL
+                continue
+            trg_class = trg_classes[t]
+            dj = j - origins[j]
+            if cepts[i][0] == j:
+                # case 2: t is the first word of a tablet
+                previous_cept = previous_cepts[j]
+                if previous_cept is not None:
+                    src_class = src_classes[src_sentence[previous_cept]]
+                else:
+                    src_class = None
+                self.head_distortion[dj][src_class][trg_class] += count
+                self.head_distortion_for_any_dj[src_class][trg_class] += count
+            else:
+                # case 3: t is a subsequent word of a tablet
+                self.non_head_distortion[dj][trg_class] += count
+                self.non_head_distortion_for_any_dj[trg_class] += count
+
+        self.update_null_generation(count, alignment_info)
+        self.update_fertility(count, alignment_info)
+
+
+def _distortion_origins(alignment_info):
+    """
+    Find what the displacement of each target word is measured from, in
+    a single pass over the cepts of ``alignment_info``, rather than
+    searching for the previous cept of every word separately.
+
+    :return: A tuple ``(previous_cepts, origins)`` of lists indexed by
+        target position ``j``, for the words that are not aligned to
+        NULL. For a head word, ``previous_cepts[j]`` is its previous
+        cept (see ``AlignmentInfo.previous_cept``) and ``origins[j]``
+        is the center of that cept. For any other word, ``origins[j]``
+        is the position of the previous word in its tablet.
+    """
+    cepts = alignment_info.cepts
+    previous_cepts = [None] * len(alignment_info.trg_sentence)
+    origins = [0] * len(alignment_info.trg_sentence)
+    previous_cept = None
+    previous_center = 0
+    for i in range(1, len(cepts)):
+        tablet = cepts[i]
+        if not tablet:
+            continue
+        previous_cepts[tablet[0]] = previous_cept
+        origins[tablet[0]] = previous_center
+        for k in range(1, len(tablet)):
+            origins[tablet[k]] = tablet[k - 1]
+        previous_cept = i
+        previous_center = int(ceil(sum(tablet) / len(tablet)))
+    return previous_cepts, origins